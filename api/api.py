@@ -1,11 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
 
 from utils.image.base64 import convert_from_base64, convert_to_base64
 from utils.image.image_processing import processing_image
 from utils.image.ocr_parser import parse_general_information
 from utils.text.handler import handle_general_information
 
+try:
+    import orjson
+except ImportError:  # Fall back to Flask's default JSON provider
+    orjson = None
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson, which escapes the large base64 strings in C.
+    """
+
+    mimetype = "application/json"
+    option = orjson.OPT_SERIALIZE_NUMPY if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # Pass the serialized bytes as-is, skipping the bytes -> str round trip
+        return self._app.response_class(
+            orjson.dumps(obj, option=self.option), mimetype=self.mimetype
+        )
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# OpenCV and pybase64 release the GIL, so output images are encoded in parallel
+# while the request thread runs the OCR
+encode_pool = ThreadPoolExecutor(max_workers=3)
 
 
 @app.route("/api/invoice_detector", methods=["POST"])
@@ -16,17 +53,23 @@ def predict():
     # print(base64_encoded_str)
 
     image = convert_from_base64(image_encoded_str)
-    # print(image.shape)
+    # Flask only emits DEBUG records when the app runs in debug mode
+    app.logger.debug("image.shape=%s", getattr(image, "shape", None))
 
     cropped, deskewed, table_roi, table_information = processing_image(image)
 
-    p1_image_encoded_str = convert_to_base64(cropped)
-    p2_image_encoded_str = convert_to_base64(deskewed)
-    p3_image_encoded_str = convert_to_base64(table_roi)
+    futures = [
+        encode_pool.submit(convert_to_base64, img)
+        for img in (cropped, deskewed, table_roi)
+    ]
 
     general_information = parse_general_information(cropped)
     profile_info, order_summary = handle_general_information(general_information)
 
+    p1_image_encoded_str, p2_image_encoded_str, p3_image_encoded_str = [
+        future.result() for future in futures
+    ]
+
     return {
         "original": image_encoded_str,
         "gray": p1_image_encoded_str,
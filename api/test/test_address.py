@@ -1,5 +1,26 @@
+import re
+import sys
 import unittest
 
+from data.district import DISTRICT_DICTIONARY
+from data.province import PROVINCE_DICTIONARY
+from data.ward import WARD_DICTIONARY
+from utils.address.helper import (_clean_full_address, _fast_clean,
+                                  add_space_separator, clean_abbrev_address,
+                                  clean_dash_address, clean_digit_district,
+                                  clean_digit_ward, clean_full_address,
+                                  clear_clean_cache, init_cap_words,
+                                  last_index_of_regex, remove_accent,
+                                  remove_punctuation, remove_spare_space,
+                                  replace_last_occurrences)
+from utils.address.parser import (_AUTOMATA, _AUTOMATA_MAXSIZE,
+                                  _CACHED_PARSERS, _build_automaton,
+                                  _ending_check, _find_last_word,
+                                  build_address_automata, cached_parse_address,
+                                  clear_address_caches, parse_address)
+from utils.address.regex import (DICT_NORM_ABBREV, DICT_NORM_CITY_DASH,
+                                 SPECIAL_ENDING, SPECIAL_ENDING_CHARS)
+
 
 class TestInitCapWords(unittest.TestCase):
     def test_normal_case(self):
@@ -74,6 +95,16 @@ class TestCleanDashAddress(unittest.TestCase):
             "Enjoying Ho Chi Minh nightlife",
         )
 
+    def test_synonym_glued_to_previous_word(self):
+        self.assertEqual(
+            clean_dash_address("Tp.Ba Ria Vung Tau", DICT_NORM_CITY_DASH),
+            "Tp. Ba Ria - Vung Tau",
+        )
+        self.assertEqual(
+            clean_dash_address("Tp.Ba Ria Vung Tau", self.dict_norm_city_dash),
+            "Tp.Ba Ria - Vung Tau",
+        )
+
     def test_partial_word_not_replaced(self):
         self.assertEqual(
             clean_dash_address("Brvton Beach is great", self.dict_norm_city_dash),
@@ -196,6 +227,100 @@ class TestCleanDigitWard(unittest.TestCase):
         self.assertEqual(clean_digit_ward("f7"), "P7")
 
 
+class TestFastClean(unittest.TestCase):
+    def regex_clean(self, text):
+        return clean_digit_ward(
+            clean_digit_district(clean_abbrev_address(text, DICT_NORM_ABBREV))
+        )
+
+    def test_matches_regex_cleaners(self):
+        for text in [
+            "q 01",
+            "Q0",
+            "quan1x",
+            "f02",
+            "P:4",
+            "Tp.q.1",
+            "TP.q.1,P.2",
+            "QuAn 07, PhUoNg 003",
+            "tP:Hcm p.5 F9",
+            "Q 01 q02 Q00",
+            "phuong12b",
+            "quan 1 f 2",
+            "x:Tan Dinh h.Cu Chi",
+            "",
+        ]:
+            with self.subTest(text=text):
+                self.assertEqual(_fast_clean(text), self.regex_clean(text))
+
+    def test_expected_output(self):
+        self.assertEqual(_fast_clean("q 01"), "Q1")
+        self.assertEqual(_fast_clean("Q0"), "Q0")
+        self.assertEqual(_fast_clean("quan1x"), "quan1x")
+        self.assertEqual(_fast_clean("f02"), "P2")
+        self.assertEqual(_fast_clean("P:4"), "P4")
+        self.assertEqual(_fast_clean("Tp.q.1"), "Tp Q1")
+        self.assertEqual(_fast_clean("QuAn 07, PhUoNg 003"), "Q7, P3")
+
+
+class TestCleanFullAddress(unittest.TestCase):
+    def test_standard_cleaning(self):
+        self.assertEqual(
+            clean_full_address("Phường 03, Quận 01, Tp.Hcm"),
+            "P3, Q1, Tp Ho Chi Minh",
+        )
+
+    def test_invalid_inputs(self):
+        for text in (123, None, ["Q1"], {"Q1": 1}):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    clean_full_address(text)
+
+
+class TestRemoveAccent(unittest.TestCase):
+    def test_vietnamese_vowels(self):
+        replacements = {
+            "a": "àáạảãâầấậẩẫăằắặẳẵ",
+            "A": "ÀÁẠẢÃĂẰẮẶẲẴÂẦẤẬẨẪ",
+            "e": "èéẹẻẽêềếệểễ",
+            "E": "ÈÉẸẺẼÊỀẾỆỂỄ",
+            "o": "òóọỏõôồốộổỗơờớợởỡ",
+            "O": "ÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠ",
+            "i": "ìíịỉĩ",
+            "I": "ÌÍỊỈĨ",
+            "u": "ùúụủũưừứựửữ",
+            "U": "ƯỪỨỰỬỮÙÚỤỦŨ",
+            "y": "ỳýỵỷỹ",
+            "Y": "ỲÝỴỶỸ",
+            "d": "đ",
+            "D": "Đ",
+        }
+        for non_accent, accents in replacements.items():
+            with self.subTest(non_accent=non_accent):
+                self.assertEqual(remove_accent(accents), non_accent * len(accents))
+
+    def test_address(self):
+        self.assertEqual(
+            remove_accent("Phường Bến Nghé, Quận 1, Thành phố Hồ Chí Minh"),
+            "Phuong Ben Nghe, Quan 1, Thanh pho Ho Chi Minh",
+        )
+        self.assertEqual(remove_accent("Đường Lê Lợi"), "Duong Le Loi")
+
+    def test_decomposed_input(self):
+        self.assertEqual(remove_accent("Ho\u0302\u0300 Chi\u0301 Minh"), "Ho Chi Minh")
+
+    def test_other_latin_accents(self):
+        self.assertEqual(remove_accent("ñüçé"), "nuce")
+
+    def test_no_accent(self):
+        self.assertEqual(remove_accent("Ha Noi 123, P.5"), "Ha Noi 123, P.5")
+        self.assertEqual(remove_accent(""), "")
+
+    def test_non_string_input(self):
+        with self.assertRaises(ValueError):
+            remove_accent(123)
+
+
 class TestRemoveSpareSpace(unittest.TestCase):
     def test_normal_spaces(self):
         self.assertEqual(remove_spare_space("Hello  World"), "Hello World")
@@ -346,5 +471,130 @@ class TestReplaceLastOccurrences(unittest.TestCase):
         self.assertEqual(replace_last_occurrences("test", "", "new"), "test")
 
 
+class TestParseAddress(unittest.TestCase):
+    def test_city_dash_without_space(self):
+        self.assertEqual(
+            parse_address(
+                "So 5, Phuong Long Huong, Tp.Ba Ria Vung Tau",
+                PROVINCE_DICTIONARY,
+                DISTRICT_DICTIONARY,
+                WARD_DICTIONARY,
+                SPECIAL_ENDING,
+            ),
+            "So 5, Phường Long Hương, Thành phố Bà Rịa, Tỉnh Bà Rịa - Vũng Tàu",
+        )
+
+
+class TestFindLastWord(unittest.TestCase):
+    def setUp(self):
+        self.db = {
+            "HN": {"words": ["ha noi", "ha"]},
+            "HUE": {"words": ["hue"]},
+            "NAM": {"words": ["quang nam"]},
+            "NAM2": {"words": ["quang nam"]},
+        }
+        self.automaton = _build_automaton(self.db)
+
+    def test_right_most_match_wins(self):
+        self.assertEqual(
+            _find_last_word(self.automaton, "hue ha noi"), ("HN", "ha noi")
+        )
+        self.assertEqual(_find_last_word(self.automaton, "ha noi hue"), ("HUE", "hue"))
+
+    def test_longer_word_wins_on_same_start(self):
+        self.assertEqual(
+            _find_last_word(self.automaton, "so 1 ha noi"), ("HN", "ha noi")
+        )
+        self.assertEqual(_find_last_word(self.automaton, "so 1 ha"), ("HN", "ha"))
+
+    def test_allowed_order_breaks_ties(self):
+        self.assertEqual(
+            _find_last_word(self.automaton, "quang nam"), ("NAM", "quang nam")
+        )
+        self.assertEqual(
+            _find_last_word(self.automaton, "quang nam", allowed=["NAM2", "NAM"]),
+            ("NAM2", "quang nam"),
+        )
+        self.assertEqual(
+            _find_last_word(self.automaton, "hue quang nam", allowed=["HUE"]),
+            ("HUE", "hue"),
+        )
+        self.assertEqual(_find_last_word(self.automaton, "hue", allowed=[]), ("", ""))
+
+    def test_ending_check(self):
+        for special_ending in (SPECIAL_ENDING, r"[,\s]"):
+            ending = _ending_check(special_ending)
+            self.assertEqual(
+                _find_last_word(self.automaton, "hue, huey", ending=ending),
+                ("HUE", "hue"),
+            )
+            self.assertEqual(
+                _find_last_word(self.automaton, "hue", ending=ending), ("", "")
+            )
+
+    def test_special_ending_chars(self):
+        matched = frozenset(
+            filter(
+                re.compile(SPECIAL_ENDING).fullmatch,
+                map(chr, range(sys.maxunicode + 1)),
+            )
+        )
+        self.assertEqual(SPECIAL_ENDING_CHARS, matched)
+
+        ending = _ending_check(SPECIAL_ENDING)
+        self.assertEqual(
+            _find_last_word(self.automaton, "hue\xa0x", ending=ending), ("HUE", "hue")
+        )
+
+    def test_no_match(self):
+        self.assertEqual(_find_last_word(self.automaton, "da nang"), ("", ""))
+        self.assertEqual(_find_last_word(_build_automaton({}), "hue"), ("", ""))
+
+
+class TestBuildAddressAutomata(unittest.TestCase):
+    def test_reuses_automata(self):
+        db = {"HUE": {"words": ["hue"]}}
+        self.assertIs(
+            build_address_automata(db, db, db), build_address_automata(db, db, db)
+        )
+
+    def test_cache_is_bounded(self):
+        for _ in range(_AUTOMATA_MAXSIZE + 2):
+            db = {"HUE": {"words": ["hue"]}}
+            build_address_automata(db, db, db)
+        self.assertLessEqual(len(_AUTOMATA), _AUTOMATA_MAXSIZE)
+
+
+class TestClearAddressCaches(unittest.TestCase):
+    address = "So 5, Phuong Long Huong, Tp.Ba Ria Vung Tau"
+
+    def test_clear_clean_cache(self):
+        clean_full_address("Phường 03, Quận 01")
+        self.assertGreater(_clean_full_address.cache_info().currsize, 0)
+        clear_clean_cache()
+        self.assertEqual(_clean_full_address.cache_info().currsize, 0)
+
+    def test_clears_every_cache(self):
+        parse = cached_parse_address(
+            PROVINCE_DICTIONARY,
+            DISTRICT_DICTIONARY,
+            WARD_DICTIONARY,
+            SPECIAL_ENDING_CHARS,
+        )
+        self.assertIn(parse, _CACHED_PARSERS)
+        expected = parse(self.address)
+        self.assertEqual(parse(self.address), expected)
+        self.assertEqual(parse.cache_info().hits, 1)
+        self.assertGreater(len(_AUTOMATA), 0)
+        self.assertGreater(_clean_full_address.cache_info().currsize, 0)
+
+        clear_address_caches()
+
+        self.assertEqual(parse.cache_info().currsize, 0)
+        self.assertEqual(len(_AUTOMATA), 0)
+        self.assertEqual(_clean_full_address.cache_info().currsize, 0)
+        self.assertEqual(parse(self.address), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+import base64
+import queue
+import unittest
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from utils.image import base64 as image_base64
+from utils.image.base64 import convert_from_base64, convert_to_base64
+
+
+class TestConvertFromBase64(unittest.TestCase):
+    def setUp(self):
+        # Small thresholds so the test payloads span several chunks
+        patches = [
+            mock.patch.object(image_base64, "CHUNKED_DECODE_THRESHOLD", 1000),
+            mock.patch.object(image_base64, "DECODE_CHUNK_SIZE", 400),
+            mock.patch.object(image_base64, "_BUFFER_POOL", queue.Queue(4)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        rng = np.random.default_rng(0)
+        self.image = rng.integers(0, 256, (40, 40, 3), dtype=np.uint8)
+        success, encoded_image = cv2.imencode(".png", self.image)
+        self.assertTrue(success)
+        self.data = base64.b64encode(encoded_image.tobytes()).decode("ascii")
+        self.assertGreater(len(self.data), image_base64.CHUNKED_DECODE_THRESHOLD)
+
+    def assertDecodes(self, base64_string):
+        image = convert_from_base64(base64_string)
+        self.assertIsNotNone(image)
+        np.testing.assert_array_equal(image, self.image)
+
+    def test_chunked_round_trip(self):
+        self.assertDecodes("data:image/png;base64," + self.data)
+
+    def test_embedded_whitespace(self):
+        data = self.data[:401] + " " + self.data[401:1203] + "\t" + self.data[1203:]
+        # Misaligned chunks fail, so the one-shot fallback is taken
+        with self.assertRaises(ValueError):
+            image_base64._decode_chunked(data, 0, len(data), bytearray(len(data)))
+        self.assertDecodes("data:image/png;base64," + data)
+
+    def test_trailing_crlf(self):
+        self.assertDecodes("data:image/png;base64," + self.data + "\r\n")
+        self.assertDecodes("data:image/png;base64," + self.data + "\r\nextra line")
+
+    def test_buffer_released_on_failure(self):
+        # Valid base64 that is not an image, then a length that cannot be decoded
+        for data in ("A" * 2000, self.data + "A"):
+            with self.subTest(length=len(data)):
+                image_base64._BUFFER_POOL.queue.clear()
+                self.assertIsNone(convert_from_base64("data:image/png;base64," + data))
+                self.assertEqual(image_base64._BUFFER_POOL.qsize(), 1)
+
+    def test_pooled_buffer_reused(self):
+        self.assertDecodes("data:image/png;base64," + self.data)
+        buffer = image_base64._BUFFER_POOL.queue[0]
+        self.assertDecodes("data:image/png;base64," + self.data)
+        self.assertIs(image_base64._BUFFER_POOL.queue[0], buffer)
+
+    def test_invalid_prefix(self):
+        self.assertIsNone(convert_from_base64(self.data))
+        self.assertIsNone(convert_from_base64("data:image/png;base64,"))
+
+
+class TestConvertToBase64(unittest.TestCase):
+    def test_png_round_trip(self):
+        image = np.arange(300, dtype=np.uint8).reshape(10, 10, 3)
+        base64_string = convert_to_base64(image, ".png")
+        self.assertTrue(base64_string.startswith("data:image/png;base64,"))
+        np.testing.assert_array_equal(convert_from_base64(base64_string), image)
+
+    def test_jpeg_mime_type(self):
+        image = np.zeros((8, 8, 3), dtype=np.uint8)
+        self.assertTrue(convert_to_base64(image).startswith("data:image/jpeg;base64,"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,95 @@
+import functools
 import re
 import unicodedata
 
-from utils.address.regex import (CHECK_SPELL_WORDS,
+from utils.address.regex import (ADDRESS_PUNCTUATIONS, CHECK_SPELL_WORDS,
                                  CHECK_SPELL_WORDS_NO_ACCENT, DICT_NORM_ABBREV,
                                  DICT_NORM_CITY_DASH)
 
 
+def _synonym_items(dict_norm: dict) -> tuple:
+    """
+    Hashable snapshot of a normalization dictionary, used as cache key.
+    """
+    return tuple((key, tuple(synonyms)) for key, synonyms in dict_norm.items())
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_synonyms(items: tuple, capitalize: bool = False) -> tuple:
+    """
+    Combine every synonym of a normalization dictionary into one alternation regex,
+    longest synonyms first so that overlapping entries prefer the longer form.
+
+    Args:
+        items (tuple): Dictionary snapshot from `_synonym_items`.
+        capitalize (bool): Capitalize the keys stored in the lookup.
+
+    Returns:
+        tuple: (compiled pattern, dict mapping each lowercased synonym to its key)
+    """
+    lookup = {
+        synonym.lower(): key.capitalize() if capitalize else key
+        for key, synonyms in items
+        for synonym in synonyms
+    }
+    synonyms = sorted(
+        (synonym for _, synonyms in items for synonym in synonyms),
+        key=len,
+        reverse=True,
+    )
+    pattern = "(" + "|".join(map(re.escape, synonyms)) + ")"
+    return re.compile(pattern, re.IGNORECASE), lookup
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_key_patterns(items: tuple) -> tuple:
+    """
+    Compile one regex per dictionary key, joining its synonyms with r"\b|\b".
+    The keys are applied one after another, so each pattern also sees the spaces
+    inserted by earlier replacements.
+
+    Args:
+        items (tuple): Dictionary snapshot from `_synonym_items`.
+
+    Returns:
+        tuple: (compiled pattern, key) pairs in dictionary order
+    """
+    return tuple(
+        (re.compile(r"\b|\b".join(map(re.escape, synonyms)), re.IGNORECASE), key)
+        for key, synonyms in items
+    )
+
+
+# Precompiled patterns, built once at import time
+_ABBREV_RE, _ABBREV_LOOKUP = _compile_synonyms(
+    _synonym_items(DICT_NORM_ABBREV), capitalize=True
+)
+_CITY_DASH_PATTERNS = _compile_key_patterns(_synonym_items(DICT_NORM_CITY_DASH))
+
+_DISTRICT_RE1 = re.compile(r"\b(q|quan)\s*(\d+)\b", re.IGNORECASE)
+_DISTRICT_RE2 = re.compile(r"\bQ0+(\d+)\b")
+_WARD_RE1 = re.compile(r"\b(p|phuong)\s*(\d+)\b", re.IGNORECASE)
+_WARD_RE2 = re.compile(r"\b[Ff](\d+)\b")
+_WARD_RE3 = re.compile(r"\bP0+(\d+)\b")
+_COMMA_RE = re.compile(r"\s*,\s*")
+_DOT_HYPH_RE = re.compile(r"[._-]")
+_PUNCT_RE = re.compile("[" + re.escape("".join(ADDRESS_PUNCTUATIONS)) + "]")
+_COMBINING_RE = re.compile(r"[\u0300-\u036f]")
+_DIACRITIC_TABLE = str.maketrans({"đ": "d", "Đ": "D"})
+
+# Lookup tables for the hand-written scanner in `_fast_clean`.
+# Call `clear_clean_cache()` after toggling `_fast_clean_enabled`.
+_fast_clean_enabled = True
+_ABBREV_TOKENS = tuple(sorted(_ABBREV_LOOKUP, key=len, reverse=True))
+_ABBREV_FIRST_CHARS = frozenset(token[0] for token in _ABBREV_TOKENS)
+# lowercase first char -> (prefixes, canonical letter, space allowed before digits)
+_DIGIT_PREFIXES = {
+    "q": (("quan", "q"), "Q", True),
+    "p": (("phuong", "p"), "P", True),
+    "f": (("f",), "P", False),
+}
+
+
 def remove_abundant_part(address: str) -> str:
     # List of redundant words to be removed
     redundant_words = [
@@ -38,7 +122,7 @@ def remove_abundant_part(address: str) -> str:
     cleaned_address = re.sub(r"[\s,:.!?]{2,}", " ", cleaned_address)
 
     # Remove extra spaces
-    cleaned_address = re.sub(r"\s+", " ", cleaned_address).strip()
+    cleaned_address = " ".join(cleaned_address.split())
 
     return cleaned_address
 
@@ -98,7 +182,7 @@ def correct_misspelled_words(target: str, no_accent_target: str) -> str:
 
             # Replace the misspelled word in target with the correct word
             target = target[:start_idx] + correct_word + target[end_idx:]
-    target = re.sub(r"\s+", " ", target).strip()
+    target = " ".join(target.split())
 
     return target
 
@@ -122,6 +206,7 @@ def init_cap_words(text: str) -> str:
 def remove_accent(text: str) -> str:
     """
     Remove Vietnamese diacritics from the string.
+    Other accented Latin letters are stripped too (e.g. "ñ" -> "n", "ü" -> "u").
 
     Args:
         text (str): Input string with diacritics.
@@ -132,33 +217,10 @@ def remove_accent(text: str) -> str:
     if not isinstance(text, str):
         raise ValueError("The input must be a string")
 
-    # Normalize Unicode and remove diacritic marks
-    # text = unicodedata.normalize("NFD", text)
-    text = re.sub(r"[\u0300-\u036f]", "", text)
-
-    # Replace accented characters with non-accented versions
-    replacements = {
-        "a": "àáạảãâầấậẩẫăằắặẳẵ",
-        "A": "ÀÁẠẢÃĂẰẮẶẲẴÂẦẤẬẨẪ",
-        "e": "èéẹẻẽêềếệểễ",
-        "E": "ÈÉẸẺẼÊỀẾỆỂỄ",
-        "o": "òóọỏõôồốộổỗơờớợởỡ",
-        "O": "ÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠ",
-        "i": "ìíịỉĩ",
-        "I": "ÌÍỊỈĨ",
-        "u": "ùúụủũưừứựửữ",
-        "U": "ƯỪỨỰỬỮÙÚỤỦŨ",
-        "y": "ỳýỵỷỹ",
-        "Y": "ỲÝỴỶỸ",
-        "d": "đ",
-        "D": "Đ",
-    }
-
-    for non_accent, accents in replacements.items():
-        for accent in accents:
-            text = text.replace(accent, non_accent)
-
-    return text
+    # Decompose accented letters, drop the combining marks, then map "đ"/"Đ"
+    return _COMBINING_RE.sub("", unicodedata.normalize("NFD", text)).translate(
+        _DIACRITIC_TABLE
+    )
 
 
 def clean_dash_address(text: str, dict_norm_city_dash: dict) -> str:
@@ -178,11 +240,15 @@ def clean_dash_address(text: str, dict_norm_city_dash: dict) -> str:
     if not isinstance(dict_norm_city_dash, dict):
         raise ValueError("DICT_NORM_CITY_DASH must be a dictionary")
 
-    for key, synonyms in dict_norm_city_dash.items():
-        pattern = r"\b|\b".join(map(re.escape, synonyms))
-        text = re.sub(pattern, key, text, flags=re.IGNORECASE)
+    if dict_norm_city_dash is DICT_NORM_CITY_DASH:
+        patterns = _CITY_DASH_PATTERNS
+    else:
+        patterns = _compile_key_patterns(_synonym_items(dict_norm_city_dash))
+
+    for pattern, key in patterns:
+        text = pattern.sub(key, text)
 
-    text = re.sub(r"\s+", " ", text).strip()
+    text = " ".join(text.split())
 
     return text
 
@@ -204,15 +270,16 @@ def clean_abbrev_address(text: str, dict_norm_abbrev: dict) -> str:
     if not isinstance(dict_norm_abbrev, dict):
         raise ValueError("DICT_NORM_ABBREV must be a dictionary")
 
-    for key, synonyms in dict_norm_abbrev.items():
-        pattern = r"(" + "|".join(map(re.escape, synonyms)) + r")"
+    if dict_norm_abbrev is DICT_NORM_ABBREV:
+        pattern, lookup = _ABBREV_RE, _ABBREV_LOOKUP
+    else:
+        pattern, lookup = _compile_synonyms(
+            _synonym_items(dict_norm_abbrev), capitalize=True
+        )
 
-        def replacement(match):
-            return key.capitalize()
+    text = pattern.sub(lambda match: lookup[match.group(0).lower()], text)
 
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-
-    text = re.sub(r"\s+", " ", text).strip()
+    text = " ".join(text.split())
 
     return text
 
@@ -230,10 +297,10 @@ def clean_digit_district(text: str) -> str:
         str: Standardized address string.
     """
     # Normalize "Quan" (District) to "Q"
-    text = re.sub(r"\b(q|quan)\s*(\d+)\b", r"Q\2", text, flags=re.IGNORECASE)
+    text = _DISTRICT_RE1.sub(r"Q\2", text)
 
     # Remove leading zeros in district numbers (e.g., Q01 -> Q1, Q002 -> Q2)
-    text = re.sub(r"\bQ0+(\d+)\b", r"Q\1", text)
+    text = _DISTRICT_RE2.sub(r"Q\1", text)
 
     return text
 
@@ -252,13 +319,13 @@ def clean_digit_ward(text: str) -> str:
         str: Standardized address string.
     """
     # Normalize "Phuong" (Ward) to "P"
-    text = re.sub(r"\b(p|phuong)\s*(\d+)\b", r"P\2", text, flags=re.IGNORECASE)
+    text = _WARD_RE1.sub(r"P\2", text)
 
     # Replace "F" or "f" with "P" (e.g., F1 -> P1, f02 -> P2)
-    text = re.sub(r"\b[Ff](\d+)\b", r"P\1", text)
+    text = _WARD_RE2.sub(r"P\1", text)
 
     # Remove unnecessary leading zeros (P01 -> P1, P002 -> P2)
-    text = re.sub(r"\bP0+(\d+)\b", r"P\1", text)
+    text = _WARD_RE3.sub(r"P\1", text)
 
     return text
 
@@ -276,7 +343,7 @@ def remove_spare_space(text: str) -> str:
     Returns:
         str: String with extra spaces removed.
     """
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
 
 
 def remove_punctuation(text: str, punctuations: list) -> str:
@@ -298,8 +365,11 @@ def remove_punctuation(text: str, punctuations: list) -> str:
     if not punctuations:
         return remove_spare_space(text)
 
-    pattern = f"[{''.join(map(re.escape, punctuations))}]"
-    text = re.sub(pattern, "", text)
+    if punctuations is ADDRESS_PUNCTUATIONS:
+        pattern = _PUNCT_RE
+    else:
+        pattern = re.compile(f"[{''.join(map(re.escape, punctuations))}]")
+    text = pattern.sub("", text)
 
     return remove_spare_space(text)
 
@@ -319,11 +389,9 @@ def add_space_separator(text: str) -> str:
     Returns:
         str: Standardized string with proper spacing and capitalization.
     """
-    text = re.sub(r"\s*,\s*", ", ", text)  # Ensure exactly one space after commas
-    text = re.sub(
-        r"[._-]", " ", text
-    )  # Replace dots, hyphens, and underscores with spaces
-    text = re.sub(r"\s+", " ", text).strip()  # Normalize spaces
+    text = _COMMA_RE.sub(", ", text)  # Ensure exactly one space after commas
+    text = _DOT_HYPH_RE.sub(" ", text)  # Replace dots, hyphens, underscores by spaces
+    text = " ".join(text.split())  # Normalize spaces
 
     return init_cap_words(text)  # Capitalize first letters of words
 
@@ -370,6 +438,75 @@ def replace_last_occurrences(target_str: str, substr: str, replacement: str) ->
     )
 
 
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _fast_clean(text: str) -> str:
+    """
+    Hand-written equivalent of `clean_abbrev_address`, `clean_digit_district`
+    and `clean_digit_ward` for ASCII input, without going through the regex engine.
+
+    Args:
+        text (str): ASCII address string.
+
+    Returns:
+        str: Standardized address string.
+    """
+    # Pass 1: expand abbreviations ("Q." -> "Q ", "Tp:" -> "Tp ", ...)
+    lowered = text.lower()
+    parts = []
+    start = i = 0
+    n = len(text)
+    while i < n:
+        if lowered[i] in _ABBREV_FIRST_CHARS:
+            for token in _ABBREV_TOKENS:
+                if lowered.startswith(token, i):
+                    parts.append(text[start:i])
+                    parts.append(_ABBREV_LOOKUP[token])
+                    i += len(token)
+                    start = i
+                    break
+            else:
+                i += 1
+        else:
+            i += 1
+    parts.append(text[start:])
+    text = " ".join("".join(parts).split())
+
+    # Pass 2: "quan 01" -> "Q1", "phuong 02" / "f02" -> "P2"
+    lowered = text.lower()
+    parts = []
+    start = i = 0
+    n = len(text)
+    while i < n:
+        prefix = _DIGIT_PREFIXES.get(lowered[i])
+        if prefix and (i == 0 or not _is_word_char(text[i - 1])):
+            words, letter, allow_space = prefix
+            for word in words:
+                if not lowered.startswith(word, i):
+                    continue
+                j = i + len(word)
+                if allow_space:
+                    while j < n and text[j].isspace():
+                        j += 1
+                k = j
+                while k < n and text[k].isdigit():
+                    k += 1
+                if k > j and (k == n or not _is_word_char(text[k])):
+                    parts.append(text[start:i])
+                    parts.append(letter + (text[j:k].lstrip("0") or "0"))
+                    start = i = k
+                    break
+            else:
+                i += 1
+        else:
+            i += 1
+    parts.append(text[start:])
+
+    return "".join(parts)
+
+
 def clean_full_address(text: str) -> str:
     """
     Standardize an address by handling capitalization, accent removal, district/ward normalization,
@@ -384,15 +521,34 @@ def clean_full_address(text: str) -> str:
     if not isinstance(text, str):
         raise ValueError("Input must be a string")
 
+    return _clean_full_address(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_full_address(text: str) -> str:
+    """
+    Memoized body of `clean_full_address`, called only with strings.
+    """
     # text = remove_punctuation(text, ADDRESS_PUNCTUATIONS)
     # text = add_space_separator(text)
 
     text = remove_accent(text)
 
     text = clean_dash_address(text, DICT_NORM_CITY_DASH)
-    text = clean_abbrev_address(text, DICT_NORM_ABBREV)
 
-    text = clean_digit_district(text)
-    text = clean_digit_ward(text)
+    if _fast_clean_enabled and text.isascii():
+        text = _fast_clean(text)
+    else:
+        text = clean_abbrev_address(text, DICT_NORM_ABBREV)
+        text = clean_digit_district(text)
+        text = clean_digit_ward(text)
 
     return text
+
+
+def clear_clean_cache() -> None:
+    """
+    Drop the memoized results of `clean_full_address`.
+    Must be called after changing `_fast_clean_enabled` or the normalization dictionaries.
+    """
+    _clean_full_address.cache_clear()
@@ -1,47 +1,156 @@
+import functools
 import re
+import weakref
 
+import ahocorasick
 from unidecode import unidecode
 
 from utils.address.helper import (add_space_separator, clean_full_address,
-                                  correct_misspelled_words,
-                                  last_index_of_regex,
+                                  clear_clean_cache, correct_misspelled_words,
                                   matching_and_find_substring,
                                   remove_abundant_part, remove_punctuation,
                                   replace_last_occurrences)
-from utils.address.regex import ADDRESS_PUNCTUATIONS
+from utils.address.regex import (ADDRESS_PUNCTUATIONS, SPECIAL_ENDING,
+                                 SPECIAL_ENDING_CHARS)
 
+# Automata built per (provinces, districts, wards) database, keyed by object ids,
+# least recently used first. The databases are kept in the value so their ids stay
+# valid; the size cap keeps one-off databases from being held forever.
+_AUTOMATA = {}
+_AUTOMATA_MAXSIZE = 4
 
-def parse_address(
-    input_address, db_provinces, db_districts, db_wards, special_ending, debug=False
-):
+# Memoized parsers created by `cached_parse_address`, dropped with their last user
+_CACHED_PARSERS = weakref.WeakSet()
 
-    # Preprocess the address
-    normalized_address = remove_punctuation(input_address, ADDRESS_PUNCTUATIONS)
-    normalized_address = add_space_separator(normalized_address)
 
-    address = clean_full_address(normalized_address) + ","
+def _build_automaton(db: dict) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton mapping every reversed word of a
+    province/district/ward database to (word, [keys owning the word in database order]).
+    Scanning the reversed address reports the right-most matches first.
+    """
+    automaton = ahocorasick.Automaton()
+    for key, data in db.items():
+        for word in data["words"]:
+            reversed_word = word[::-1]
+            if reversed_word in automaton:
+                automaton.get(reversed_word)[1].append(key)
+            else:
+                automaton.add_word(reversed_word, (word, [key]))
+    automaton.make_automaton()
+    return automaton
 
-    founded_province = ""
-    founded_district = ""
-    founded_ward = ""
 
-    choose_word = ""
+def build_address_automata(db_provinces, db_districts, db_wards):
+    """
+    Build (once per database) the province, district and ward automata used by `parse_address`.
+
+    Returns:
+        tuple: (province automaton, district automaton, ward automaton)
+    """
+    key = (id(db_provinces), id(db_districts), id(db_wards))
+    entry = _AUTOMATA.pop(key, None)
+    if entry is None:
+        entry = (
+            (db_provinces, db_districts, db_wards),
+            (
+                _build_automaton(db_provinces),
+                _build_automaton(db_districts),
+                _build_automaton(db_wards),
+            ),
+        )
+        while len(_AUTOMATA) >= _AUTOMATA_MAXSIZE:
+            del _AUTOMATA[next(iter(_AUTOMATA))]
+    _AUTOMATA[key] = entry
+    return entry[1]
+
+
+def _ending_check(special_ending):
+    """
+    Build the check applied to the character right after a district/ward word.
+
+    Args:
+        special_ending (str | frozenset): Regex matching the character, or the set of
+            allowed characters. SPECIAL_ENDING is served by SPECIAL_ENDING_CHARS.
+
+    Returns:
+        Callable[[str, int], bool]: Check on (address, index after the word).
+    """
+    if special_ending == SPECIAL_ENDING:
+        special_ending = SPECIAL_ENDING_CHARS
+
+    if isinstance(special_ending, str):
+        return re.compile(special_ending).match
+
+    def check(address, index):
+        return index < len(address) and address[index] in special_ending
+
+    return check
+
+
+def _find_last_word(automaton, address, allowed=None, ending=None):
+    """
+    Find the right-most word of the automaton in the address.
+    If two words start at the same index, prioritize the longer one.
+
+    Args:
+        automaton (ahocorasick.Automaton): Automaton built by `_build_automaton`.
+        address (str): Address to search.
+        allowed (list): Keys allowed to match, in priority order. All keys if None.
+        ending (Callable[[str, int], bool]): Check on the index after the word, if given.
+
+    Returns:
+        tuple: (key, word) of the chosen component, or ("", "") if nothing matches.
+    """
+    if automaton.kind == ahocorasick.EMPTY:
+        return "", ""
+
+    rank = {key: i for i, key in enumerate(allowed)} if allowed is not None else None
     largest_index = -1
+    choose_word = ""
+    founded = ""
+
+    # Matches come in decreasing order of their start index in the original address
+    last_position = len(address) - 1
+    for end, (word, keys) in automaton.iter(address[::-1]):
+        last_index = last_position - end
+        if last_index < largest_index:
+            # Every remaining match starts further left than the chosen word
+            break
+        if len(word) <= len(choose_word):
+            continue
+        if ending is not None and not ending(address, last_index + len(word)):
+            continue
+        if rank is None:
+            key = keys[0]
+        else:
+            candidates = [key for key in keys if key in rank]
+            if not candidates:
+                continue
+            key = min(candidates, key=rank.get)
+        founded, choose_word, largest_index = key, word, last_index
+
+    return founded, choose_word
+
+
+def _extract_components(address, db_provinces, db_districts, db_wards, special_ending):
+    """
+    Extract Province/City, District and Ward/Commune from a cleaned address,
+    removing each found component from the address.
+
+    Returns:
+        tuple: (remaining address, province key, district key, ward key)
+    """
+    province_ac, district_ac, ward_ac = build_address_automata(
+        db_provinces, db_districts, db_wards
+    )
+    ending = _ending_check(special_ending)
+
+    founded_ward = ""
 
     # Extract Province/City
-    for province, province_data in db_provinces.items():
-        for word in province_data["words"]:
-            # Select the closest component (Province, District, Ward) from the right of the address
-            last_index = address.rfind(word)
-            # If two components have the same index, prioritize the longer string
-            if (last_index > largest_index) or (
-                (last_index == largest_index)
-                and (largest_index > -1)
-                and (len(word) > len(choose_word))
-            ):
-                founded_province = province
-                choose_word = word
-                largest_index = last_index
+    # Select the closest component (Province, District, Ward) from the right of the address
+    founded_province, choose_word = _find_last_word(province_ac, address)
 
     # If a Province/City is found, remove it from the address (only the last occurrence)
     if founded_province:
@@ -50,38 +159,18 @@ def parse_address(
     if address.endswith("Thanh Pho ,"):
         address = address.replace("Thanh Pho ,", "")
 
-    choose_word = ""
-    largest_index = -1
-
     # Extract District after extracting Province/City
     if founded_province:
-        for district in db_provinces[founded_province]["district"]:
-            for word in db_districts[district]["words"]:
-                reg_word = re.compile(rf"{word}{special_ending}")
-                last_index = last_index_of_regex(address, reg_word)
-                if (last_index > largest_index) or (
-                    (last_index == largest_index)
-                    and (largest_index > -1)
-                    and (len(word) > len(choose_word))
-                ):
-                    founded_district = district
-                    choose_word = word
-                    largest_index = last_index
+        founded_district, choose_word = _find_last_word(
+            district_ac,
+            address,
+            allowed=db_provinces[founded_province]["district"],
+            ending=ending,
+        )
     else:
         # Extract District when Province/City is not present in the address
         # (Inferring Province/City from the District)
-        for district, district_data in db_districts.items():
-            for word in district_data["words"]:
-                reg_word = re.compile(rf"{word}")
-                last_index = last_index_of_regex(address, reg_word)
-                if (last_index > largest_index) or (
-                    (last_index == largest_index)
-                    and (largest_index > -1)
-                    and (len(word) > len(choose_word))
-                ):
-                    founded_district = district
-                    choose_word = word
-                    largest_index = last_index
+        founded_district, choose_word = _find_last_word(district_ac, address)
 
     if founded_district:
         address = replace_last_occurrences(address, choose_word, "")
@@ -96,26 +185,43 @@ def parse_address(
                 "",
             )
 
-    largest_index = -1
-    choose_word = ""
-
     # Extract Ward/Commune
     if founded_district:
-        for ward in db_districts[founded_district]["ward"]:
-            for word in db_wards[ward]["words"]:
-                reg_word = re.compile(rf"{word}{special_ending}")
-                last_index = last_index_of_regex(address, reg_word)
-                if (last_index > largest_index) or (
-                    (last_index == largest_index)
-                    and (largest_index > -1)
-                    and (len(word) > len(choose_word))
-                ):
-                    founded_ward = ward
-                    choose_word = word
-                    largest_index = last_index
+        founded_ward, choose_word = _find_last_word(
+            ward_ac,
+            address,
+            allowed=db_districts[founded_district]["ward"],
+            ending=ending,
+        )
         if founded_ward:
             address = replace_last_occurrences(address, choose_word, "")
 
+    return address, founded_province, founded_district, founded_ward
+
+
+def parse_address(
+    input_address, db_provinces, db_districts, db_wards, special_ending, debug=False
+):
+
+    # Preprocess the address
+    normalized_address = remove_punctuation(input_address, ADDRESS_PUNCTUATIONS)
+    normalized_address = add_space_separator(normalized_address)
+
+    # Nothing to parse
+    if not normalized_address:
+        return ""
+
+    address = clean_full_address(normalized_address) + ","
+
+    # Every dictionary word contains a letter, so the lookups can be skipped
+    # for addresses without any (e.g. only a house number)
+    if any(char.isalpha() for char in address):
+        address, founded_province, founded_district, founded_ward = _extract_components(
+            address, db_provinces, db_districts, db_wards, special_ending
+        )
+    else:
+        founded_province = founded_district = founded_ward = ""
+
     # Map results to Province, District, and Ward names
     founded_province = db_provinces.get(founded_province, {}).get("name", "")
     founded_district = db_districts.get(founded_district, {}).get("name", "")
@@ -146,6 +252,37 @@ def parse_address(
     # Filter out empty values before joining
     address_parts = [address_lv4, founded_ward, founded_district, founded_province]
     modified_address = ", ".join(filter(None, address_parts))
-    modified_address = re.sub(r"\s+", " ", modified_address).strip()
+    modified_address = " ".join(modified_address.split())
 
     return modified_address
+
+
+def cached_parse_address(
+    db_provinces, db_districts, db_wards, special_ending, maxsize=4096
+):
+    """
+    Bind `parse_address` to the given databases and memoize it on the input address.
+
+    Returns:
+        Callable[[str], str]: Memoized parser taking only the input address.
+    """
+
+    @functools.lru_cache(maxsize=maxsize)
+    def parse(input_address):
+        return parse_address(
+            input_address, db_provinces, db_districts, db_wards, special_ending
+        )
+
+    _CACHED_PARSERS.add(parse)
+    return parse
+
+
+def clear_address_caches():
+    """
+    Drop every cached automaton and memoized result.
+    Must be called after the province/district/ward databases are reloaded.
+    """
+    _AUTOMATA.clear()
+    clear_clean_cache()
+    for parse in _CACHED_PARSERS:
+        parse.cache_clear()
@@ -36,3 +36,12 @@ CHECK_SPELL_WORDS_NO_ACCENT = [
 CHECK_SPELL_WORDS = ["Ấp", "Làng", "Xóm", "Thôn", "Khu", "Đường", "Hẻm", "Ngõ"]
 
 SPECIAL_ENDING = r"[g.;,\s]"
+
+# Characters matched by SPECIAL_ENDING, for plain set lookups:
+# "g.;," plus every code point matched by \s
+SPECIAL_ENDING_CHARS = frozenset(
+    "g.;,"
+    " \t\n\v\f\r\x1c\x1d\x1e\x1f\x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
@@ -1,30 +1,97 @@
-import base64
+import queue
 import re
 
 import cv2
 import numpy as np
 
+try:
+    import pybase64 as _b64
+except ImportError:  # Fall back to the standard library codec
+    import base64 as _b64
 
-def convert_from_base64(full_base64_string):
+# JPEG quality used by `convert_to_base64`
+JPEG_QUALITY = 85
+
+
+# Payloads longer than this are decoded chunk by chunk into a pooled buffer
+CHUNKED_DECODE_THRESHOLD = 1_000_000
+# Chunk size in base64 characters, a multiple of 4 so chunks decode independently
+DECODE_CHUNK_SIZE = 4 * (1 << 20)
+
+_DATA_URI_RE = re.compile(r"data:image/(?P<format>png|jpeg|jpg);base64,")
+
+# Free list of decode buffers reused across requests
+_BUFFER_POOL = queue.Queue(maxsize=4)
+
+
+def _acquire_buffer(size):
+    try:
+        buffer = _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(size)
+
+    # Never resize a pooled buffer in place, views on it may still be alive
+    return buffer if len(buffer) >= size else bytearray(size)
+
+
+def _release_buffer(buffer):
     try:
-        match = re.match(
-            r"data:image/(?P<format>png|jpeg|jpg);base64,(?P<data>.+)",
-            full_base64_string,
+        _BUFFER_POOL.put_nowait(buffer)
+    except queue.Full:
+        pass
+
+
+def _decode_chunked(base64_string, start, end, buffer):
+    """
+    Decode `base64_string[start:end]` into `buffer` chunk by chunk,
+    so no full-size temporary string or bytes object is created.
+
+    Returns:
+        memoryview: View over the decoded bytes in `buffer`.
+    """
+    size = 0
+    for offset in range(start, end, DECODE_CHUNK_SIZE):
+        chunk = _b64.b64decode(
+            base64_string[offset : min(offset + DECODE_CHUNK_SIZE, end)],
+            validate=False,
         )
+        buffer[size : size + len(chunk)] = chunk
+        size += len(chunk)
 
-        if not match:
+    return memoryview(buffer)[:size]
+
+
+def convert_from_base64(full_base64_string):
+    buffer = None
+    try:
+        match = _DATA_URI_RE.match(full_base64_string)
+
+        # Data runs until the end of the line
+        start = match.end() if match else 0
+        end = full_base64_string.find("\n", start)
+        if end == -1:
+            end = len(full_base64_string)
+
+        if not match or start == end:
             raise ValueError("Invalid base64 string or wrong format image!")
 
         # Get format (png, jpeg, jpg)
         image_format = match.group("format")
 
-        # Get data
-        base64_string = match.group("data")
-
         # Decode base64 to bytes
-        image_bytes = base64.b64decode(base64_string)
-
-        # Convert bytes to NumPy array
+        if end - start > CHUNKED_DECODE_THRESHOLD:
+            buffer = _acquire_buffer((end - start) // 4 * 3)
+            try:
+                image_bytes = _decode_chunked(full_base64_string, start, end, buffer)
+            except ValueError:
+                # Chunks are misaligned (e.g. embedded whitespace), decode in one shot
+                image_bytes = _b64.b64decode(
+                    full_base64_string[start:end], validate=False
+                )
+        else:
+            image_bytes = _b64.b64decode(full_base64_string[start:end], validate=False)
+
+        # Convert bytes to NumPy array (no copy, the array views the decoded bytes)
         image_nparr = np.frombuffer(image_bytes, np.uint8)
 
         # Decode image using OpenCV
@@ -37,17 +104,30 @@ def convert_from_base64(full_base64_string):
     except Exception as e:
         print(f"Error decoding base64 to image: {e}")
         return None
+    finally:
+        if buffer is not None:
+            _release_buffer(buffer)
+
+
+def _b64encode_as_string(data):
+    if hasattr(_b64, "b64encode_as_string"):
+        # pybase64 builds the str directly, skipping the intermediate bytes object
+        return _b64.b64encode_as_string(data)
+    return _b64.b64encode(data).decode("ascii")
 
 
 def convert_to_base64(image, format=".jpg"):
     try:
         # Encode image as bytes
-        success, encoded_image = cv2.imencode(format, image)
+        params = []
+        if format.lower() in (".jpg", ".jpeg"):
+            params = [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]
+        success, encoded_image = cv2.imencode(format, image, params)
         if not success:
             raise ValueError("Image encoding failed.")
 
         # Convert to base64 string
-        base64_str = base64.b64encode(encoded_image).decode("utf-8")
+        base64_str = _b64encode_as_string(encoded_image)
 
         # Determine MIME type based on format
         format = format.lower().replace(".", "")  # Remove leading dot (".jpg" → "jpg")
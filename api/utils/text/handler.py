@@ -8,8 +8,8 @@ from data.name import (FIRST_NAMES_DICT, FIRST_NAMES_SET, LAST_NAMES_DICT,
 from data.product_token_shop import PRODUCT_TOKENS
 from data.province import PROVINCE_DICTIONARY
 from data.ward import WARD_DICTIONARY
-from utils.address.parser import parse_address
-from utils.address.regex import SPECIAL_ENDING
+from utils.address.parser import build_address_automata, cached_parse_address
+from utils.address.regex import SPECIAL_ENDING_CHARS
 from utils.text.helper import (clean_text_before_unidecode, extract_address,
                                extract_and_normalize_phone_numbers,
                                extract_information, extract_name,
@@ -24,6 +24,12 @@ from utils.text.regex import (ADDRESS_PATTERN, CREATED_TIME_PATTERN,
                               SHOP_NAME_PATTERN, TABLE_COLUMN_MAPPING,
                               TOTAL_AMOUNT_PATTERN, TOTAL_QUANTITY_PATTERN)
 
+# Build the address automata and the memoized parser at process start
+build_address_automata(PROVINCE_DICTIONARY, DISTRICT_DICTIONARY, WARD_DICTIONARY)
+parse_address_cached = cached_parse_address(
+    PROVINCE_DICTIONARY, DISTRICT_DICTIONARY, WARD_DICTIONARY, SPECIAL_ENDING_CHARS
+)
+
 
 def handle_general_information(general_information):
 
@@ -102,13 +108,7 @@ def handle_general_information(general_information):
         target, no_accent_target, ADDRESS_PATTERN, direct=True
     )
     address = extract_address(address)
-    address = parse_address(
-        address,
-        PROVINCE_DICTIONARY,
-        DISTRICT_DICTIONARY,
-        WARD_DICTIONARY,
-        SPECIAL_ENDING,
-    )
+    address = parse_address_cached(address)
     profile_info["address"] = address
 
     region = extract_information(target, no_accent_target, REGION_PATTERN, direct=True)